@@ -0,0 +1,314 @@
+import os
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import pytest
+from PyQt5.QtCore import QSaveFile, QThreadPool
+from PyQt5.QtGui import QKeySequence
+from PyQt5.QtWidgets import QApplication
+
+import text_editor
+from text_editor import TextDocumentModel, TextEditorController, TextEditorMainWindow
+
+
+@pytest.fixture(scope="module")
+def app():
+    return QApplication.instance() or QApplication([])
+
+
+@pytest.fixture
+def editor(app):
+    model = TextDocumentModel()
+    view = TextEditorMainWindow()
+    controller = TextEditorController(model, view)
+    yield model, view, controller
+    view.close()
+
+
+def wait_until(app, condition, timeout=5.0):
+    """Process events until condition() holds."""
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "timed out waiting for the editor"
+        app.processEvents()
+
+
+def flush_save(controller):
+    """Run the throttled save now instead of waiting for its window to end."""
+    TextEditorController._write_to_path.throttler(controller).flush()
+
+
+def choose_files(monkeypatch, *paths):
+    """Make the file dialogs return paths one after another."""
+    chosen = iter(str(path) for path in paths)
+    monkeypatch.setattr(
+        TextEditorController, "_selected_path", staticmethod(lambda dialog: next(chosen))
+    )
+
+
+def test_open_inserts_text_from_the_event_loop(app, editor, tmp_path, monkeypatch):
+    _model, view, _controller = editor
+    path = tmp_path / "chunks.txt"
+    path.write_text("0123456789\nabcdefghij", encoding="utf-8")
+    monkeypatch.setattr(text_editor, "INSERT_CHUNK_SIZE", 4)
+    choose_files(monkeypatch, path)
+
+    view.act_open.trigger()
+    wait_until(app, view.is_loading)
+    assert view.text_edit.isReadOnly()
+    wait_until(app, lambda: not view.is_loading())
+
+    assert view.text_edit.toPlainText() == "0123456789\nabcdefghij"
+    assert not view.text_edit.isReadOnly()
+    assert view.windowTitle() == f"PyQt Text Editor - {path}"
+
+
+def test_save_is_refused_while_a_file_is_inserted(app, editor, tmp_path, monkeypatch):
+    model, view, controller = editor
+    opened = tmp_path / "opened.txt"
+    opened.write_text("x" * 100, encoding="utf-8")
+    monkeypatch.setattr(text_editor, "INSERT_CHUNK_SIZE", 10)
+    choose_files(monkeypatch, opened)
+
+    view.act_open.trigger()
+    wait_until(app, view.is_loading)
+    view.act_save.trigger()
+    flush_save(controller)
+    wait_until(app, lambda: not view.is_loading())
+    QThreadPool.globalInstance().waitForDone()
+
+    assert opened.read_text(encoding="utf-8") == "x" * 100
+    assert model.file_path == str(opened)
+
+
+def test_new_abandons_a_running_load(app, editor, tmp_path, monkeypatch):
+    _model, view, _controller = editor
+    path = tmp_path / "long.txt"
+    path.write_text("y" * 100, encoding="utf-8")
+    monkeypatch.setattr(text_editor, "INSERT_CHUNK_SIZE", 10)
+    choose_files(monkeypatch, path)
+
+    view.act_open.trigger()
+    wait_until(app, view.is_loading)
+    view.act_new.trigger()
+    for _ in range(20):
+        app.processEvents()
+
+    assert not view.is_loading()
+    assert view.text_edit.toPlainText() == ""
+    assert not view.text_edit.isReadOnly()
+    assert view.windowTitle() == "PyQt Text Editor"
+
+
+def test_save_writes_editor_text(app, editor, tmp_path):
+    model, view, controller = editor
+    path = tmp_path / "saved.txt"
+    model.file_path = str(path)
+    view.text_edit.setPlainText("first line\nsecond line")
+
+    view.act_save.trigger()
+    flush_save(controller)
+    wait_until(app, lambda: view.windowTitle() == f"PyQt Text Editor - {path}")
+
+    assert path.read_text(encoding="utf-8") == "first line\nsecond line"
+    assert model.content == "first line\nsecond line"
+
+
+def test_overlapping_opens_show_the_last_chosen_file(app, editor, tmp_path, monkeypatch):
+    model, view, _controller = editor
+    first = tmp_path / "first.txt"
+    first.write_text("first\n" * 100_000, encoding="utf-8")
+    second = tmp_path / "second.txt"
+    second.write_text("second", encoding="utf-8")
+    choose_files(monkeypatch, first, second)
+
+    view.act_open.trigger()
+    view.act_open.trigger()
+    wait_until(app, lambda: view.windowTitle() == f"PyQt Text Editor - {second}")
+    QThreadPool.globalInstance().waitForDone()
+    for _ in range(20):
+        app.processEvents()
+
+    assert view.text_edit.toPlainText() == "second"
+    assert model.file_path == str(second)
+    assert model.content == "second"
+
+
+def test_rapid_saves_write_once_with_the_latest_text(app, editor, tmp_path):
+    model, view, controller = editor
+    path = tmp_path / "throttled.txt"
+    model.file_path = str(path)
+
+    view.text_edit.setPlainText("draft")
+    view.act_save.trigger()
+    view.text_edit.setPlainText("final")
+    view.act_save.trigger()
+    assert not path.exists()
+    flush_save(controller)
+    wait_until(app, lambda: view.windowTitle() == f"PyQt Text Editor - {path}")
+
+    assert path.read_text(encoding="utf-8") == "final"
+
+
+def test_pending_save_is_written_before_another_file_is_shown(
+    app, editor, tmp_path, monkeypatch
+):
+    model, view, controller = editor
+    edited = tmp_path / "edited.txt"
+    other = tmp_path / "other.txt"
+    other.write_text("other", encoding="utf-8")
+    model.file_path = str(edited)
+    choose_files(monkeypatch, other)
+
+    view.text_edit.setPlainText("unsaved edit")
+    view.act_save.trigger()
+    view.act_open.trigger()
+    wait_until(app, lambda: model.file_path == str(other))
+    controller._save_pool.waitForDone()
+
+    assert edited.read_text(encoding="utf-8") == "unsaved edit"
+    assert view.text_edit.toPlainText() == "other"
+
+
+def test_closing_writes_a_pending_save(app, editor, tmp_path):
+    model, view, _controller = editor
+    path = tmp_path / "closing.txt"
+    model.file_path = str(path)
+
+    view.text_edit.setPlainText("written on close")
+    view.act_save.trigger()
+    view.close()
+
+    assert path.read_text(encoding="utf-8") == "written on close"
+
+
+def test_snapshot_is_reused_until_the_document_changes(app, editor):
+    model, view, _controller = editor
+    document = view.text_edit.document()
+    view.text_edit.setPlainText("unchanged")
+
+    first = model.snapshot(document)
+    assert model.snapshot(document) is first
+
+    view.text_edit.appendPlainText("edited")
+    assert model.snapshot(document) == "unchanged\nedited"
+
+
+def test_opened_text_is_the_snapshot_until_edited(app, editor, tmp_path, monkeypatch):
+    model, view, _controller = editor
+    path = tmp_path / "opened.txt"
+    path.write_text("from disk", encoding="utf-8")
+    choose_files(monkeypatch, path)
+
+    view.act_open.trigger()
+    wait_until(app, lambda: model.file_path == str(path))
+
+    assert model.snapshot(view.text_edit.document()) is model.content
+
+
+def test_load_translates_newlines_like_text_mode(tmp_path):
+    path = tmp_path / "newlines.txt"
+    path.write_bytes(b"dos\r\nmac\runix\n")
+
+    content, _content_hash = TextDocumentModel.load_from_disk(str(path))
+    assert content == "dos\nmac\nunix\n"
+
+
+def test_load_decodes_characters_split_between_reads(tmp_path, monkeypatch):
+    path = tmp_path / "split.txt"
+    path.write_bytes("a€b\r\nc".encode("utf-8"))
+    # Both "€", three bytes long, and "\r\n" are split between two reads.
+    monkeypatch.setattr(text_editor, "READ_CHUNK_SIZE", 2)
+
+    content, _content_hash = TextDocumentModel.load_from_disk(str(path))
+    assert content == "a€b\nc"
+
+
+@pytest.mark.skipif(not os.path.exists("/proc/version"), reason="needs procfs")
+def test_load_reads_files_that_report_no_size():
+    with open("/proc/version", encoding="utf-8") as file:
+        expected = file.read()
+
+    assert expected
+    content, _content_hash = TextDocumentModel.load_from_disk("/proc/version")
+    assert content == expected
+
+
+def test_standard_actions_get_every_platform_binding(app, editor):
+    _model, view, _controller = editor
+
+    assert view.act_redo.shortcuts() == QKeySequence.keyBindings(QKeySequence.Redo)
+    assert view.act_exit.shortcuts() == [QKeySequence("Ctrl+Q")]
+
+
+def reopen(app, view, path):
+    """Open path again and wait until the editor reports it as opened."""
+    view.statusBar().clearMessage()
+    view.act_open.trigger()
+    wait_until(app, lambda: view.statusBar().currentMessage() == f"Opened: {path}")
+
+
+def test_reopening_an_unchanged_file_keeps_the_document(app, editor, tmp_path, monkeypatch):
+    _model, view, _controller = editor
+    path = tmp_path / "same.txt"
+    path.write_text("same text", encoding="utf-8")
+    choose_files(monkeypatch, path, path)
+    reopen(app, view, path)
+    revision = view.text_edit.document().revision()
+
+    reopen(app, view, path)
+
+    assert view.text_edit.document().revision() == revision
+    assert view.text_edit.toPlainText() == "same text"
+
+
+def test_reopening_after_an_edit_reads_the_file(app, editor, tmp_path, monkeypatch):
+    _model, view, _controller = editor
+    path = tmp_path / "edited.txt"
+    path.write_text("on disk", encoding="utf-8")
+    choose_files(monkeypatch, path, path)
+    reopen(app, view, path)
+    view.text_edit.appendPlainText("unsaved")
+
+    reopen(app, view, path)
+
+    assert view.text_edit.toPlainText() == "on disk"
+
+
+def test_edit_during_an_unchanged_reopen_reads_the_file(app, editor, tmp_path, monkeypatch):
+    _model, view, controller = editor
+    path = tmp_path / "raced.txt"
+    path.write_text("on disk", encoding="utf-8")
+    choose_files(monkeypatch, path)
+    reopen(app, view, path)
+    _content, content_hash = TextDocumentModel.load_from_disk(str(path))
+
+    # The worker found the file unchanged, but the user typed before its result arrived.
+    view.text_edit.appendPlainText("typed meanwhile")
+    view.statusBar().clearMessage()
+    controller._on_file_loaded(controller._load_token, str(path), (None, content_hash))
+    wait_until(app, lambda: view.statusBar().currentMessage() == f"Opened: {path}")
+
+    assert view.text_edit.toPlainText() == "on disk"
+
+
+def test_save_reports_a_missing_directory(tmp_path):
+    with pytest.raises(OSError):
+        TextDocumentModel.save_to_disk(str(tmp_path / "missing" / "file.txt"), "text")
+
+
+def test_failed_save_keeps_the_previous_file(tmp_path, monkeypatch):
+    path = tmp_path / "kept.txt"
+    path.write_text("previous", encoding="utf-8")
+
+    class FailingSaveFile(QSaveFile):
+        def write(self, data):
+            return -1
+
+    monkeypatch.setattr(text_editor, "QSaveFile", FailingSaveFile)
+    with pytest.raises(OSError):
+        TextDocumentModel.save_to_disk(str(path), "replacement")
+
+    assert path.read_text(encoding="utf-8") == "previous"
+    assert [entry.name for entry in tmp_path.iterdir()] == ["kept.txt"]
@@ -1,68 +1,269 @@
+import codecs
+import hashlib
+import io
 import sys
-from typing import Dict, Optional
+from functools import partial, wraps
+from typing import Any, Callable, List, Optional, Tuple, Union
 from PyQt5.QtWidgets import (
     QApplication,
     QMainWindow,
-    QTextEdit,
+    QPlainTextEdit,
     QAction,
     QFileDialog,
     QMessageBox,
     QToolBar,
 )
-from PyQt5.QtGui import QIcon
-from PyQt5.QtCore import Qt
+from PyQt5.QtGui import QCloseEvent, QIcon, QKeySequence, QTextCursor, QTextDocument
+from PyQt5.QtCore import (
+    QCoreApplication,
+    QEvent,
+    QIODevice,
+    QObject,
+    QRunnable,
+    QSaveFile,
+    QThreadPool,
+    QTimer,
+    pyqtSignal,
+)
+
+# Number of characters inserted into the editor per event loop pass when opening a file.
+INSERT_CHUNK_SIZE = 1 << 19
+# Number of bytes read from disk and decoded at a time when opening a file.
+READ_CHUNK_SIZE = 1 << 20
+# Name filters offered by the open and save dialogs.
+FILE_NAME_FILTERS = ["Text Files (*.txt)", "All Files (*)"]
+# Attribute in which TextEditorController keeps the throttler of its saves.
+_SAVE_THROTTLER = "_write_to_path_throttler"
+# Icon shared by all actions; an empty QIcon needs no QApplication to exist yet.
+_EMPTY_ICON = QIcon()
+
+# Key, text, shortcut and status tip of every action of the main window.
+# Standard keys get all key bindings of the platform. QKeySequence.Quit has none on
+# Windows, so Exit keeps an explicit sequence, parsed once here.
+_Shortcut = Union[QKeySequence, QKeySequence.StandardKey, None]
+_ACTION_SPECS: Tuple[Tuple[str, str, _Shortcut, str], ...] = (
+    ("new", "New", QKeySequence.New, "Create a new document"),
+    ("open", "Open...", QKeySequence.Open, "Open an existing text file"),
+    ("save", "Save", QKeySequence.Save, "Save the current document"),
+    ("save_as", "Save As...", None, "Save the current document under a new name"),
+    ("exit", "Exit", QKeySequence("Ctrl+Q"), "Exit the application"),
+    ("undo", "Undo", QKeySequence.Undo, "Undo last action"),
+    ("redo", "Redo", QKeySequence.Redo, "Redo last undone action"),
+    ("cut", "Cut", QKeySequence.Cut, "Cut selection to clipboard"),
+    ("copy", "Copy", QKeySequence.Copy, "Copy selection to clipboard"),
+    ("paste", "Paste", QKeySequence.Paste, "Paste text from clipboard"),
+    ("about", "About", None, "Show information about this application"),
+)
+
+
+class _Throttler:
+    """Collapse calls made within a time window into a single call."""
+
+    def __init__(self, callback: Callable[..., None], timeout: int, leading: bool) -> None:
+        self._callback = callback
+        self._leading = leading
+        self._pending_args: Optional[Tuple[Any, ...]] = None
+        self._timer = QTimer()
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(timeout)
+        self._timer.timeout.connect(self._on_timeout)
+
+    def __call__(self, *args: Any) -> None:
+        if self._timer.isActive():
+            self._pending_args = args
+            return
+        if self._leading:
+            self._callback(*args)
+        else:
+            self._pending_args = args
+        self._timer.start()
+
+    def flush(self) -> None:
+        """Run the pending call now instead of when the window ends."""
+        self._timer.stop()
+        self._on_timeout()
+
+    def _on_timeout(self) -> None:
+        if self._pending_args is None:
+            return
+        args, self._pending_args = self._pending_args, None
+        self._callback(*args)
+
+
+def qthrottled(
+    timeout: int, leading: bool = True, attribute: Optional[str] = None
+) -> Callable[[Callable[..., None]], Callable[..., None]]:
+    """Decorate a method so calls within timeout milliseconds run it at most once.
+
+    With leading=False only the latest call of the window runs, when the window ends.
+    Each instance keeps its throttler in attribute, by default the method name plus
+    "_throttler". The decorated method's throttler(instance) returns it.
+    """
+
+    def decorator(method: Callable[..., None]) -> Callable[..., None]:
+        name = attribute or f"{method.__name__}_throttler"
+
+        def throttler(instance: Any) -> _Throttler:
+            existing = getattr(instance, name, None)
+            if existing is None:
+                existing = _Throttler(partial(method, instance), timeout, leading)
+                setattr(instance, name, existing)
+            return existing
+
+        @wraps(method)
+        def wrapper(self: Any, *args: Any) -> None:
+            throttler(self)(*args)
+
+        wrapper.throttler = throttler  # type: ignore[attr-defined]
+        return wrapper
+
+    return decorator
 
 
 class TextDocumentModel:
     """Model that manages the current text document and file path."""
 
+    __slots__ = (
+        "file_path",
+        "content",
+        "_content_revision",
+        "_loaded_hash",
+        "_loaded_revision",
+    )
+
     def __init__(self) -> None:
-        self._file_path: Optional[str] = None
-        self._content: str = ""
-
-    @property
-    def file_path(self) -> Optional[str]:
-        """Return current document path."""
-        return self._file_path
-
-    @file_path.setter
-    def file_path(self, value: Optional[str]) -> None:
-        """Set current document path."""
-        self._file_path = value
-
-    @property
-    def content(self) -> str:
-        """Return current document content."""
-        return self._content
-
-    @content.setter
-    def content(self, value: str) -> None:
-        """Set current document content."""
-        self._content = value
-
-    def load_from_disk(self, path: str) -> str:
-        """Load text content from disk and update model state."""
-        with open(path, "r", encoding="utf-8") as file:
-            self._content = file.read()
-        self._file_path = path
-        return self._content
-
-    def save_to_disk(self, path: Optional[str] = None) -> str:
+        self.file_path: Optional[str] = None
+        self.content: str = ""
+        # QTextDocument.revision() that content was taken from, -1 if unknown.
+        self._content_revision = -1
+        # Hash of the file that was opened last and the revision it was shown at.
+        self._loaded_hash: Optional[bytes] = None
+        self._loaded_revision = -1
+
+    def set_document(self, path: str, content: str, revision: int, content_hash: bytes) -> None:
+        """Store a document that has been read from disk and shown at revision."""
+        self.file_path = path
+        self.content = content
+        self._content_revision = revision
+        self._loaded_hash = content_hash
+        self._loaded_revision = revision
+
+    def clear(self) -> None:
+        """Forget the current document, as for a new empty one."""
+        self.file_path = None
+        self.content = ""
+        self._content_revision = -1
+        self._loaded_hash = None
+        self._loaded_revision = -1
+
+    def unchanged_hash(self, document: QTextDocument) -> Optional[bytes]:
+        """Return the hash of the opened file if document still shows it unedited."""
+        if document.revision() != self._loaded_revision:
+            return None
+        return self._loaded_hash
+
+    def snapshot(self, document: QTextDocument) -> str:
+        """Return the text of document, reusing the last copy while it is unchanged."""
+        revision = document.revision()
+        if revision != self._content_revision:
+            self.content = document.toPlainText()
+            self._content_revision = revision
+        return self.content
+
+    @staticmethod
+    def load_from_disk(
+        path: str, known_hash: Optional[bytes] = None
+    ) -> Tuple[Optional[str], bytes]:
+        """Load text content and its hash from disk; content is None if it hashes to known_hash."""
+        # Decode one reused buffer at a time instead of holding all bytes of the file.
+        # IncrementalNewlineDecoder keeps the universal newlines of a text-mode read.
+        decoder = io.IncrementalNewlineDecoder(
+            codecs.getincrementaldecoder("utf-8")(), translate=True
+        )
+        content_hash = hashlib.blake2b(digest_size=16)
+        buffer = bytearray(READ_CHUNK_SIZE)
+        view = memoryview(buffer)
+        parts: List[str] = []
+        with open(path, "rb", buffering=0) as file:
+            while True:
+                count = file.readinto(buffer)
+                if not count:
+                    break
+                content_hash.update(view[:count])
+                parts.append(decoder.decode(view[:count]))
+        parts.append(decoder.decode(b"", final=True))
+        digest = content_hash.digest()
+        if digest == known_hash:
+            return None, digest
+        return "".join(parts), digest
+
+    @staticmethod
+    def save_to_disk(path: str, content: str) -> str:
         """Save text content to disk and return the path used."""
-        if path is not None:
-            self._file_path = path
-        if self._file_path is None:
-            raise ValueError("File path is not set.")
-        with open(self._file_path, "w", encoding="utf-8") as file:
-            file.write(self._content)
-        return self._file_path
+        # QSaveFile writes a temporary file and only replaces path on commit(), so a
+        # failed save leaves the previous file intact. Text mode translates newlines.
+        file = QSaveFile(path)
+        if not file.open(QIODevice.WriteOnly | QIODevice.Text):
+            raise OSError(file.errorString())
+        data = content.encode("utf-8")
+        if file.write(data) != len(data):
+            message = file.errorString()
+            file.cancelWriting()
+            raise OSError(message)
+        if not file.commit():
+            raise OSError(file.errorString())
+        return path
+
+
+class FileIOSignals(QObject):
+    """Signals used by FileIOWorker to report back to the GUI thread."""
+
+    finished = pyqtSignal(str, object)
+    error = pyqtSignal(str)
+
+
+class FileIOWorker(QRunnable):
+    """Runnable that performs a blocking file operation on a thread pool."""
+
+    def __init__(self, operation: Callable[[str], object], path: str) -> None:
+        super().__init__()
+        self.signals = FileIOSignals()
+        self._operation = operation
+        self._path = path
+
+    def run(self) -> None:
+        """Run the operation and emit its result or error message."""
+        try:
+            result = self._operation(self._path)
+        except (OSError, ValueError) as error:
+            self.signals.error.emit(str(error))
+            return
+        self.signals.finished.emit(self._path, result)
 
 
 class TextEditorMainWindow(QMainWindow):
     """Main window that provides the text editor user interface."""
 
+    # Emitted when the window is about to close, before it is hidden.
+    closing = pyqtSignal()
+
+    # Actions created from _ACTION_SPECS by _create_actions.
+    act_new: QAction
+    act_open: QAction
+    act_save: QAction
+    act_save_as: QAction
+    act_exit: QAction
+    act_undo: QAction
+    act_redo: QAction
+    act_cut: QAction
+    act_copy: QAction
+    act_paste: QAction
+    act_about: QAction
+
     def __init__(self) -> None:
         super().__init__()
+        self._load_generation = 0
+        self._load_cursor: Optional[QTextCursor] = None
         self._setup_ui()
 
     def _setup_ui(self) -> None:
@@ -71,7 +272,7 @@ class TextEditorMainWindow(QMainWindow):
         self.resize(800, 600)
 
         # Central text editor
-        self.text_edit = QTextEdit()
+        self.text_edit = QPlainTextEdit()
         self.setCentralWidget(self.text_edit)
 
         # Status bar
@@ -84,192 +285,326 @@ class TextEditorMainWindow(QMainWindow):
 
     def _create_actions(self) -> None:
         """Create actions used in menus and toolbars."""
-        self.actions: Dict[str, QAction] = {}
-
-        new_action = QAction(QIcon(), "New", self)
-        new_action.setShortcut("Ctrl+N")
-        new_action.setStatusTip("Create a new document")
-        self.actions["new"] = new_action
-
-        open_action = QAction(QIcon(), "Open...", self)
-        open_action.setShortcut("Ctrl+O")
-        open_action.setStatusTip("Open an existing text file")
-        self.actions["open"] = open_action
-
-        save_action = QAction(QIcon(), "Save", self)
-        save_action.setShortcut("Ctrl+S")
-        save_action.setStatusTip("Save the current document")
-        self.actions["save"] = save_action
-
-        save_as_action = QAction(QIcon(), "Save As...", self)
-        save_as_action.setStatusTip("Save the current document under a new name")
-        self.actions["save_as"] = save_as_action
-
-        exit_action = QAction(QIcon(), "Exit", self)
-        exit_action.setShortcut("Ctrl+Q")
-        exit_action.setStatusTip("Exit the application")
-        self.actions["exit"] = exit_action
-
-        undo_action = QAction(QIcon(), "Undo", self)
-        undo_action.setShortcut("Ctrl+Z")
-        undo_action.setStatusTip("Undo last action")
-        self.actions["undo"] = undo_action
-
-        redo_action = QAction(QIcon(), "Redo", self)
-        redo_action.setShortcut("Ctrl+Y")
-        redo_action.setStatusTip("Redo last undone action")
-        self.actions["redo"] = redo_action
-
-        cut_action = QAction(QIcon(), "Cut", self)
-        cut_action.setShortcut("Ctrl+X")
-        cut_action.setStatusTip("Cut selection to clipboard")
-        self.actions["cut"] = cut_action
-
-        copy_action = QAction(QIcon(), "Copy", self)
-        copy_action.setShortcut("Ctrl+C")
-        copy_action.setStatusTip("Copy selection to clipboard")
-        self.actions["copy"] = copy_action
-
-        paste_action = QAction(QIcon(), "Paste", self)
-        paste_action.setShortcut("Ctrl+V")
-        paste_action.setStatusTip("Paste text from clipboard")
-        self.actions["paste"] = paste_action
-
-        about_action = QAction("About", self)
-        about_action.setStatusTip("Show information about this application")
-        self.actions["about"] = about_action
+        for key, text, shortcut, status_tip in _ACTION_SPECS:
+            action = QAction(_EMPTY_ICON, text, self)
+            if isinstance(shortcut, QKeySequence):
+                action.setShortcut(shortcut)
+            elif shortcut is not None:
+                action.setShortcuts(shortcut)
+            action.setStatusTip(status_tip)
+            setattr(self, f"act_{key}", action)
 
     def _create_menus(self) -> None:
         """Create the main menu bar and its menus."""
         menu_bar = self.menuBar()
 
         file_menu = menu_bar.addMenu("&File")
-        file_menu.addAction(self.actions["new"])
-        file_menu.addAction(self.actions["open"])
-        file_menu.addAction(self.actions["save"])
-        file_menu.addAction(self.actions["save_as"])
+        file_menu.addAction(self.act_new)
+        file_menu.addAction(self.act_open)
+        file_menu.addAction(self.act_save)
+        file_menu.addAction(self.act_save_as)
         file_menu.addSeparator()
-        file_menu.addAction(self.actions["exit"])
+        file_menu.addAction(self.act_exit)
 
         edit_menu = menu_bar.addMenu("&Edit")
-        edit_menu.addAction(self.actions["undo"])
-        edit_menu.addAction(self.actions["redo"])
+        edit_menu.addAction(self.act_undo)
+        edit_menu.addAction(self.act_redo)
         edit_menu.addSeparator()
-        edit_menu.addAction(self.actions["cut"])
-        edit_menu.addAction(self.actions["copy"])
-        edit_menu.addAction(self.actions["paste"])
+        edit_menu.addAction(self.act_cut)
+        edit_menu.addAction(self.act_copy)
+        edit_menu.addAction(self.act_paste)
 
         help_menu = menu_bar.addMenu("&Help")
-        help_menu.addAction(self.actions["about"])
+        help_menu.addAction(self.act_about)
 
     def _create_toolbars(self) -> None:
         """Create toolbars with frequently used actions."""
         file_toolbar = QToolBar("File", self)
         self.addToolBar(file_toolbar)
-        file_toolbar.addAction(self.actions["new"])
-        file_toolbar.addAction(self.actions["open"])
-        file_toolbar.addAction(self.actions["save"])
+        file_toolbar.addAction(self.act_new)
+        file_toolbar.addAction(self.act_open)
+        file_toolbar.addAction(self.act_save)
 
         edit_toolbar = QToolBar("Edit", self)
         self.addToolBar(edit_toolbar)
-        edit_toolbar.addAction(self.actions["undo"])
-        edit_toolbar.addAction(self.actions["redo"])
+        edit_toolbar.addAction(self.act_undo)
+        edit_toolbar.addAction(self.act_redo)
         edit_toolbar.addSeparator()
-        edit_toolbar.addAction(self.actions["cut"])
-        edit_toolbar.addAction(self.actions["copy"])
-        edit_toolbar.addAction(self.actions["paste"])
+        edit_toolbar.addAction(self.act_cut)
+        edit_toolbar.addAction(self.act_copy)
+        edit_toolbar.addAction(self.act_paste)
+
+    def closeEvent(self, event: QCloseEvent) -> None:
+        """Let the controller finish pending work before the window closes."""
+        self.closing.emit()
+        super().closeEvent(event)
+
+    def load_document(self, content: str, on_loaded: Callable[[], None]) -> None:
+        """Replace editor text chunk by chunk, returning to the event loop in between.
+
+        Until the last chunk is in, the editor is read-only and has repaints, signals
+        and undo history disabled; then on_loaded is called. A later load_document or
+        cancel_load abandons the load.
+        """
+        self.cancel_load()
+        text_edit = self.text_edit
+        text_edit.setUpdatesEnabled(False)
+        text_edit.setUndoRedoEnabled(False)
+        text_edit.blockSignals(True)
+        text_edit.setReadOnly(True)
+        text_edit.clear()
+        self._load_cursor = QTextCursor(text_edit.document())
+        self._insert_chunks(self._load_generation, content, 0, on_loaded)
+
+    def is_loading(self) -> bool:
+        """Return whether a load_document is still inserting text."""
+        return self._load_cursor is not None
+
+    def cancel_load(self) -> None:
+        """Abandon a running load_document, keeping the text inserted so far."""
+        if self._load_cursor is None:
+            return
+        self._load_generation += 1
+        self._finish_load()
+
+    def _insert_chunks(
+        self, generation: int, content: str, offset: int, on_loaded: Callable[[], None]
+    ) -> None:
+        """Insert the next chunk of a load and schedule the one after it."""
+        if generation != self._load_generation:
+            return
+        if offset < len(content):
+            end = offset + INSERT_CHUNK_SIZE
+            self._load_cursor.insertText(content[offset:end])
+            QTimer.singleShot(0, partial(self._insert_chunks, generation, content, end, on_loaded))
+            return
+        self._finish_load()
+        on_loaded()
+
+    def _finish_load(self) -> None:
+        """Give the editor back to the user after a load ended."""
+        self._load_cursor = None
+        text_edit = self.text_edit
+        text_edit.setReadOnly(False)
+        text_edit.blockSignals(False)
+        text_edit.setUndoRedoEnabled(True)
+        text_edit.setUpdatesEnabled(True)
 
 
 class TextEditorController:
     """Controller that connects the model and the main window."""
 
+    # PyQt refers to connected bound methods weakly, so instances need __weakref__.
+    __slots__ = (
+        "_model",
+        "_view",
+        "_save_pool",
+        "_load_token",
+        "_save_token",
+        "_document_generation",
+        "_open_dialog",
+        "_save_dialog",
+        "_about_box",
+        _SAVE_THROTTLER,
+        "__weakref__",
+    )
+
     def __init__(self, model: TextDocumentModel, view: TextEditorMainWindow) -> None:
         self._model = model
         self._view = view
+        # Saves run one at a time, so writes reach the disk in the order they were requested.
+        self._save_pool = QThreadPool()
+        self._save_pool.setMaxThreadCount(1)
+        # Tokens of the latest requested load and save; older worker results are dropped.
+        self._load_token = 0
+        self._save_token = 0
+        # Bumped whenever the editor switches to another document or file.
+        self._document_generation = 0
+        self._open_dialog = self._create_file_dialog("Open File", QFileDialog.AcceptOpen)
+        self._save_dialog = self._create_file_dialog("Save File As", QFileDialog.AcceptSave)
+        self._about_box: Optional[QMessageBox] = None
         self._connect_signals()
 
+    def _create_file_dialog(
+        self, caption: str, accept_mode: QFileDialog.AcceptMode
+    ) -> QFileDialog:
+        """Create a file dialog that is kept and reused for every open or save."""
+        dialog = QFileDialog(self._view, caption)
+        dialog.setAcceptMode(accept_mode)
+        if accept_mode == QFileDialog.AcceptOpen:
+            dialog.setFileMode(QFileDialog.ExistingFile)
+        dialog.setNameFilters(FILE_NAME_FILTERS)
+        return dialog
+
+    @staticmethod
+    def _selected_path(dialog: QFileDialog) -> str:
+        """Run dialog and return the chosen path, or an empty string if it was cancelled."""
+        if not dialog.exec_():
+            return ""
+        return dialog.selectedFiles()[0]
+
     def _connect_signals(self) -> None:
         """Connect signals of actions to controller methods."""
-        self._view.actions["new"].triggered.connect(self.new_file)
-        self._view.actions["open"].triggered.connect(self.open_file)
-        self._view.actions["save"].triggered.connect(self.save_file)
-        self._view.actions["save_as"].triggered.connect(self.save_file_as)
-        self._view.actions["exit"].triggered.connect(self._view.close)
-
-        self._view.actions["undo"].triggered.connect(self._view.text_edit.undo)
-        self._view.actions["redo"].triggered.connect(self._view.text_edit.redo)
-        self._view.actions["cut"].triggered.connect(self._view.text_edit.cut)
-        self._view.actions["copy"].triggered.connect(self._view.text_edit.copy)
-        self._view.actions["paste"].triggered.connect(self._view.text_edit.paste)
-
-        self._view.actions["about"].triggered.connect(self.show_about)
+        self._view.act_new.triggered.connect(self.new_file)
+        self._view.act_open.triggered.connect(self.open_file)
+        self._view.act_save.triggered.connect(self.save_file)
+        self._view.act_save_as.triggered.connect(self.save_file_as)
+        self._view.act_exit.triggered.connect(self._view.close)
+
+        self._view.act_undo.triggered.connect(self._view.text_edit.undo)
+        self._view.act_redo.triggered.connect(self._view.text_edit.redo)
+        self._view.act_cut.triggered.connect(self._view.text_edit.cut)
+        self._view.act_copy.triggered.connect(self._view.text_edit.copy)
+        self._view.act_paste.triggered.connect(self._view.text_edit.paste)
+
+        self._view.act_about.triggered.connect(self.show_about)
+        self._view.closing.connect(self._finish_pending_io)
+
+    def _flush_pending_save(self) -> None:
+        """Run a save still waiting in the throttle window right away."""
+        TextEditorController._write_to_path.throttler(self).flush()
+
+    def _finish_pending_io(self) -> None:
+        """Write pending saves and wait for them before the window closes."""
+        # Loads still in flight are not shown in a closing window.
+        self._load_token += 1
+        self._flush_pending_save()
+        self._view.cancel_load()
+        self._save_pool.waitForDone()
+        # Deliver the save results so a failed save is still reported.
+        QCoreApplication.sendPostedEvents(None, QEvent.MetaCall)
 
     def new_file(self) -> None:
         """Clear the editor and reset model state."""
-        self._model.file_path = None
-        self._model.content = ""
+        self._flush_pending_save()
+        self._load_token += 1
+        self._document_generation += 1
+        self._view.cancel_load()
+        self._model.clear()
         self._view.text_edit.clear()
         self._view.statusBar().showMessage("New document", 2000)
         self._view.setWindowTitle("PyQt Text Editor")
 
     def open_file(self) -> None:
         """Open a text file from disk using the model."""
-        path, _ = QFileDialog.getOpenFileName(
-            self._view,
-            "Open File",
-            "",
-            "Text Files (*.txt);;All Files (*)",
-        )
+        path = self._selected_path(self._open_dialog)
         if not path:
             return
-        try:
-            content = self._model.load_from_disk(path)
-        except OSError as error:
-            QMessageBox.critical(self._view, "Open File", f"Could not open file:\n{error}")
+        self._start_load(path, self._model.unchanged_hash(self._view.text_edit.document()))
+
+    def _start_load(self, path: str, known_hash: Optional[bytes]) -> None:
+        """Read path on a background worker; known_hash lets it skip an unchanged file."""
+        self._load_token += 1
+        load = partial(TextDocumentModel.load_from_disk, known_hash=known_hash)
+        worker = FileIOWorker(load, path)
+        worker.signals.finished.connect(partial(self._on_file_loaded, self._load_token))
+        worker.signals.error.connect(partial(self._on_open_error, self._load_token))
+        self._view.statusBar().showMessage(f"Opening: {path}")
+        QThreadPool.globalInstance().start(worker)
+
+    def _on_file_loaded(
+        self, token: int, path: str, result: Tuple[Optional[str], bytes]
+    ) -> None:
+        """Show a document read by a background worker, unless a later request superseded it."""
+        if token != self._load_token:
+            return
+        content, content_hash = result
+        document = self._view.text_edit.document()
+        if content is None and self._model.unchanged_hash(document) != content_hash:
+            # The editor changed while the file was hashed, so its text is needed after all.
+            self._start_load(path, None)
+            return
+        # A throttled save belongs to the document that is about to be replaced.
+        self._flush_pending_save()
+        self._document_generation += 1
+        if content is None:
+            # The editor already shows this text; only the path may differ.
+            self._model.file_path = path
+            self._show_opened(path)
+            return
+        shown = partial(self._on_document_shown, path, content, content_hash)
+        self._view.load_document(content, shown)
+
+    def _on_open_error(self, token: int, message: str) -> None:
+        """Report a failed background read, unless a later request superseded it."""
+        if token != self._load_token:
             return
-        self._view.text_edit.setPlainText(content)
+        self._view.statusBar().clearMessage()
+        QMessageBox.critical(self._view, "Open File", f"Could not open file:\n{message}")
+
+    def _on_document_shown(self, path: str, content: str, content_hash: bytes) -> None:
+        """Finish opening path once the editor shows all of its text."""
+        revision = self._view.text_edit.document().revision()
+        self._model.set_document(path, content, revision, content_hash)
+        self._show_opened(path)
+
+    def _show_opened(self, path: str) -> None:
+        """Report that path is now the open document."""
         self._view.statusBar().showMessage(f"Opened: {path}", 2000)
         self._view.setWindowTitle(f"PyQt Text Editor - {path}")
 
+    def _refuse_save_while_loading(self) -> bool:
+        """Tell the user and return True if a half-inserted document would be saved."""
+        if not self._view.is_loading():
+            return False
+        self._view.statusBar().showMessage("Cannot save while a file is being opened", 2000)
+        return True
+
     def save_file(self) -> None:
         """Save the current document using the model."""
+        if self._refuse_save_while_loading():
+            return
         if self._model.file_path is None:
             self.save_file_as()
             return
-        self._model.content = self._view.text_edit.toPlainText()
-        try:
-            path = self._model.save_to_disk()
-        except (OSError, ValueError) as error:
-            QMessageBox.critical(self._view, "Save File", f"Could not save file:\n{error}")
-            return
-        self._view.statusBar().showMessage(f"Saved: {path}", 2000)
+        self._write_to_path(self._model.file_path)
 
     def save_file_as(self) -> None:
         """Ask for a file path and save the current document using the model."""
-        path, _ = QFileDialog.getSaveFileName(
-            self._view,
-            "Save File As",
-            "",
-            "Text Files (*.txt);;All Files (*)",
-        )
+        if self._refuse_save_while_loading():
+            return
+        path = self._selected_path(self._save_dialog)
         if not path:
             return
-        self._model.content = self._view.text_edit.toPlainText()
-        try:
-            used_path = self._model.save_to_disk(path)
-        except OSError as error:
-            QMessageBox.critical(self._view, "Save File", f"Could not save file:\n{error}")
+        self._write_to_path(path)
+
+    @qthrottled(timeout=200, leading=False, attribute=_SAVE_THROTTLER)
+    def _write_to_path(self, path: str) -> None:
+        """Save the current editor text to path on a background worker."""
+        content = self._model.snapshot(self._view.text_edit.document())
+        save = partial(TextDocumentModel.save_to_disk, content=content)
+        worker = FileIOWorker(save, path)
+        self._save_token += 1
+        saved = partial(self._on_file_saved, self._save_token, self._document_generation)
+        worker.signals.finished.connect(saved)
+        worker.signals.error.connect(self._on_save_error)
+        self._save_pool.start(worker)
+
+    def _on_file_saved(self, token: int, generation: int, path: str, _result: object) -> None:
+        """Update model state after a background write."""
+        self._view.statusBar().showMessage(f"Saved: {path}", 2000)
+        if token != self._save_token or generation != self._document_generation:
+            # A later save, open or new has decided the path of the current document.
             return
-        self._view.statusBar().showMessage(f"Saved: {used_path}", 2000)
-        self._view.setWindowTitle(f"PyQt Text Editor - {used_path}")
+        self._model.file_path = path
+        self._view.setWindowTitle(f"PyQt Text Editor - {path}")
+
+    def _on_save_error(self, message: str) -> None:
+        """Report a failed background write."""
+        QMessageBox.critical(self._view, "Save File", f"Could not save file:\n{message}")
 
     def show_about(self) -> None:
         """Show simple About dialog."""
-        QMessageBox.information(
-            self._view,
-            "About",
-            "PyQt Text Editor\n\nExample of MVC-style PyQt application with menus and toolbars.",
-        )
+        if self._about_box is None:
+            self._about_box = QMessageBox(
+                QMessageBox.Information,
+                "About",
+                "PyQt Text Editor\n\n"
+                "Example of MVC-style PyQt application with menus and toolbars.",
+                QMessageBox.Ok,
+                self._view,
+            )
+        self._about_box.exec_()
 
 
 def main() -> None: